@@ -120,11 +120,13 @@ class ADS1248:
             # ADS1248.wregAll(0,[inputs[i]*8+ref]) # Why does this not work?
             for adc in ADS1248.list:
                 adc.wreg(0,[inputs[i]*8+ref]) # Why does this work and not ^
+            # All ADCs are now converting in parallel, collect the results
+            for adc in ADS1248.list:
                 if raw:
-                    voltages.append(adc.receive())
+                    voltages.append(adc.receive(True))
                 else:
                     try:
-                        voltages.append(adc.vref/(2**23)*adc.receive()+adc.vref)
+                        voltages.append(adc.vref/(2**23)*adc.receive(True)+adc.vref)
                     except TypeError:
                         voltages.append(None)
         return voltages
@@ -227,8 +229,8 @@ class ADS1248:
                     result.append(None)
         return result
 
-    def receive(self):
-        if self.drdy.value:
+    def receive(self, started=False): # started: conversion was begun earlier, so it may already be complete
+        if self.drdy.value or started:
             if ADS1248.verbose:
                 print("[ADS1248] [{}] [RECEIVE] Waiting for ADC...".format(ADS1248.list.index(self)))
 
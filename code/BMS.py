@@ -10,6 +10,8 @@
 #      1 if measurement/battery fault has been detected
 
 # SERCOM usage:
+# 115200 baud, 8N1
+
 # Writing:
 
 # 1xxxxxxx + xxxxxxxx + ...
@@ -55,15 +57,49 @@
 # 00000110 = All cell voltages              List of floats   160
 # 00000111 = Board temperatures             List of floats   30
 # 00001000 = Status                         List of integers 7
+# 00001001 = All cell voltages (millivolts) List of integers 100
 
 import board
 import busio
 import microcontroller
 import time
 from digitalio import Direction
+import ulab
 import adafruit_dotstar as dotstar
 
+def pad(value, width=7):
+    # ASCII encode value, zero padded to exactly width bytes, or rounded to fit if it has more digits
+    s = str(value)
+    if len(s) > width:
+        point = s.find('.')
+        if 0 <= point < width-1:
+            s = str(round(value, width-point-1))
+        elif point == width-1:
+            s = str(round(value))+'.'
+    s = s.encode('ascii')
+    if len(s) < width:
+        return s + b'0'*(width-len(s))
+    return s[:width]
+
+def putMillivolts(value, buf, off):
+    # Write value in volts as 4 ASCII digits of millivolts plus a newline into buf at off
+    mv = int(value*1000)
+    if mv < 0:
+        mv = 0
+    elif mv > 9999:
+        mv = 9999
+    buf[off] = 48 + mv//1000
+    buf[off+1] = 48 + mv//100%10
+    buf[off+2] = 48 + mv//10%10
+    buf[off+3] = 48 + mv%10
+    buf[off+4] = 10
+
 class BMS:
+    TMP_SCALE = (150/1.5)*3.3/65536 # Degrees C per AnalogIn count
+    CAP_EMPTY = 68 # Battery voltage at 0% capacity
+    CAP_SCALE = 100/(84-68) # Percent per volt between empty and full (84v)
+    DOT_SCALE = 255/100 # DotStar color per percent capacity
+
     def __init__(self, ADS1248, mcpArr, tmpArr, buzzer, relay, mos, fan):
         # Defaults for user programmable variables
         self.mode = 0 # 0 = idle, 1 = chg/bal/dschg, 2 = low power
@@ -85,28 +121,59 @@ class BMS:
         ADS1248.wregAll(2,[0x40,0x03])
         print("[INFO] Calibrating ADCs.")
         ADS1248.selfOffsetAll()
-        self.drain = [0]*24
+        self.drain = 0 # Bitmap of cells to discharge, bit i = cell i
 
         self.mcpArr = mcpArr
+        self._nMcp = len(mcpArr)
         for mcp in self.mcpArr:
             mcp.iodir = 0x00
             mcp.gpio = 0x00
 
-        self.uart = busio.UART(board.TX, board.RX, baudrate=9600, timeout=.1, receiver_buffer_size=16)
+        self.uart = busio.UART(board.TX, board.RX, baudrate=115200, timeout=.01, receiver_buffer_size=128)
         self.uart.write(bytes([127]))
+        self._rxBuf = bytearray(64) # Instruction + up to 63 bytes of data
+        # SERCOM instruction -> handler, see the instruction tables above
+        self._writeHandlers = {
+            128: self.setMode,
+            129: self.setMaxTemp,
+            130: self.setFanTrigger,
+            131: self.setMinVoltage,
+            132: self.setMaxVoltage,
+            133: self.setTargetVoltage,
+            134: self.setDV,
+            135: self.setBalTime,
+            136: self.setVerbose,
+        }
+        self._readHandlers = {
+            1: self.sendBattVoltage,
+            2: self.sendCapacity,
+            3: self.sendMeanVoltage,
+            4: self.sendMinCell,
+            5: self.sendMaxCell,
+            6: self.sendCells,
+            7: self.sendTemps,
+            8: self.sendStatus,
+            9: self.sendCellsMillivolts,
+        }
 
         self.tmpArr = tmpArr
-        self.temps = [0]*len(tmpArr)
+        self._nTmp = len(tmpArr)
+        self.temps = [0]*(self._nTmp+1) # Sensors followed by the CPU temperature
         self.fan = fan
 
         self.buz = buzzer
         self.relay = relay
         self.mos = mos
 
-        self.cellPos = [18, 15, 12, 6, 3, 9, 0, 7, 16, 13, 10, 19, 1, 4, 20, 17, 11, 5, 2, 14]
-        self.cells = [0]*self.cellCount
+        self.cellPos = (18, 15, 12, 6, 3, 9, 0, 7, 16, 13, 10, 19, 1, 4, 20, 17, 11, 5, 2, 14)
+        self.cells = ulab.zeros(self.cellCount)
+        self._cellBuf = bytearray(5*self.cellCount) # Reply buffer for all cell voltages in millivolts
+        self.lastCells = ulab.zeros(self.cellCount)
 
         self.testBalCount = 0
+        self.holdUntil = 0 # time.monotonic() deadline of the current charge/balance period, 0 if none
+        self.nextTempCheck = 0
+        self.asleep = False # ADCs put to sleep and outputs disabled by low power mode
         self.error = False
         self.enableCharge = True
         self.saveBattery = False
@@ -117,7 +184,6 @@ class BMS:
 
 
         self.getCells()
-        self.lastCells = list(self.cells)
 
         if microcontroller.nvm[0] == 1:
             print("[INFO] Attempting to charge battery...")
@@ -133,33 +199,42 @@ class BMS:
         if self.verbose:
             print("[INFO] Checking cells...")
         cellRead = BMS.ADS1248.fetchAll(3,[0,1,2,4,5,6,7])
-        for i in range(20):
-            self.cells[i] = cellRead[self.cellPos[i]]
+        cp = self.cellPos
+        c = self.cells
+        for i in range(self.cellCount):
+            c[i] = cellRead[cp[i]]
         # self.log.write(self.cells)
-        self.minCell = min(self.cells)
-        self.maxCell = max(self.cells)
-        self.minCellIndex = self.cells.index(self.minCell)
-        self.maxCellindex = self.cells.index(self.maxCell)
-        self.battVoltage = sum(self.cells)
-        self.capacity = min(max(round((100/(84-68))*(self.battVoltage-68)),0),100)
-        self.meanVoltage = sum(self.cells)/self.cellCount
-        self.dot.fill((int((-255/100)*self.capacity+255),int((255/100)*self.capacity),0))
+        self.minCellIndex = ulab.numerical.argmin(self.cells)
+        self.maxCellindex = ulab.numerical.argmax(self.cells)
+        self.minCell = self.cells[self.minCellIndex]
+        self.maxCell = self.cells[self.maxCellindex]
+        self.battVoltage = ulab.numerical.sum(self.cells)
+        capacity = round(BMS.CAP_SCALE*(self.battVoltage-BMS.CAP_EMPTY))
+        if capacity < 0:
+            capacity = 0
+        elif capacity > 100:
+            capacity = 100
+        self.capacity = capacity
+        self.meanVoltage = self.battVoltage/self.cellCount
+        self.dot.fill((int(255-BMS.DOT_SCALE*capacity),int(BMS.DOT_SCALE*capacity),0))
 
     def getTemps(self):
-        self.temps = [None]*len(self.tmpArr)
-        for i in range(len(self.tmpArr)):
-            self.temps[i] = (150/1.5)*((self.tmpArr[i].value*3.3/65536)-.5)
-        self.temps.append(microcontroller.cpu.temperature)
-        self.temps = [round(i,2) for i in self.temps]
+        n = self._nTmp
+        arr = self.tmpArr
+        temps = self.temps
+        for i in range(n):
+            temps[i] = BMS.TMP_SCALE*arr[i].value - 50 # (150/1.5)*((value*3.3/65536)-.5)
+        temps[n] = microcontroller.cpu.temperature
         if self.verbose:
-            print("[INFO] Board temperatures:", [str(i)+"C" for i in self.temps])
+            print("[INFO] Board temperatures:", [str(round(i,2))+"C" for i in self.temps])
         # duty = (65535/30)*(max(self.temps)-30)
         # self.fan.duty_cycle = 0 if duty < 0 else 65535 if duty > 65535 else duty
-        if max(self.temps) > self.fanTrigger:
+        hottest = max(self.temps)
+        if hottest > self.fanTrigger:
             self.fan.value = True
         else:
             self.fan.value = False
-        if max(self.temps) > self.maxTemp + 20:
+        if hottest > self.maxTemp + 20:
             print("[ALERT] Thermal shutdown.")
             self.buz.value = True
             self.mode = 2
@@ -168,12 +243,9 @@ class BMS:
             return False
 
     def sendIO(self):
-        for i in range(len(self.mcpArr)):
-            send = 0
-            for j in range(len(self.drain[8*i:8*(i+1)])):
-                if self.drain[8*i:8*(i+1)][j] == 1:
-                    send += 2**j
-            self.mcpArr[i].gpio = send
+        d = self.drain
+        for i in range(self._nMcp):
+            self.mcpArr[i].gpio = (d >> 8*i) & 0xFF
 
     def balance(self):
         # Target voltage is within min and max voltage
@@ -182,7 +254,7 @@ class BMS:
             self.buz.value = True
             self.relay.value = False
             self.mode = 0
-            self.drain = [0]*self.cellCount
+            self.drain = 0
             self.sendIO()
             time.sleep(1)
             return
@@ -210,21 +282,18 @@ class BMS:
                     print("[INFO] Mean cell voltage is {0}v more than target cell voltage of {1}v.".format(self.meanVoltage-self.targetVoltage, self.targetVoltage))
                 print("[INFO] Discharging...")
 
-            toDschg = []
-            for i in range(self.cellCount):
-                if self.cells[i] > target:
-                    toDschg.append(i)
-                else: self.drain[i] = 0
-            toDschg = sorted(toDschg,key=lambda x: self.cells[x],reverse=True)
-            # print([self.cells[toDschg[i]] for i in range(len(toDschg))])
-            # print(toDschg)
-            if self.cellCount//2 >= len(toDschg):
-                count = len(toDschg)
-            else:
-                count = int(self.cellCount//2)
-            for i in range(count):
-                self.drain[toDschg[i]] = 1
-            # Now that cells have been selected for discharging, send drain array to IO expanders
+            # Walk cells from highest to lowest voltage, draining at most half of them above target
+            order = ulab.numerical.argsort(self.cells)
+            drain = 0
+            count = 0
+            for i in range(self.cellCount-1, -1, -1):
+                idx = order[i]
+                if count == self.cellCount//2 or self.cells[idx] <= target:
+                    break
+                drain |= 1 << idx
+                count += 1
+            self.drain = drain
+            # Now that cells have been selected for discharging, send drain bitmap to IO expanders
             self.sendIO()
         else:
             self.balancing = False
@@ -233,7 +302,7 @@ class BMS:
             if self.testBalCount < 4:
                 print("[INFO] Confirming successful charge/balance [{}]...".format(self.testBalCount))
                 self.testBalCount += 1
-                time.sleep(8)
+                self.startHold(8)
                 return
             else:
                 print("\n[INFO] Charge/balance complete!\n")
@@ -247,18 +316,53 @@ class BMS:
                 self.mode = 0
                 self.testBalCount = 0
         else:
+            # Temperature is monitored by hold() while update() keeps servicing UART
+            self.startHold(self.balTime//8*8)
+
+    def startHold(self, duration):
+        self.holdUntil = time.monotonic() + duration
+        self.nextTempCheck = 0
+
+    def hold(self):
+        # Returns True while the charge/balance period is still running
+        now = time.monotonic()
+        if self.mode == 1 and now < self.holdUntil:
+            if now < self.nextTempCheck:
+                return True
             # Monitor temperature
-            for i in range(self.balTime//8):
-                self.getTemps()
-                if max(self.temps) > self.maxTemp:
-                    print("[INFO] Temperature exceeded maximum permitted temperature while balancing.")
-                    break
-                time.sleep(8)
-            # Clear drain and disconnect charger for next update
-            self.drain = [0]*self.cellCount
-            self.relay.value = False
+            self.nextTempCheck = now + 8
+            self.getTemps()
+            if max(self.temps) <= self.maxTemp:
+                return True
+            print("[INFO] Temperature exceeded maximum permitted temperature while balancing.")
+        # Clear drain and disconnect charger for next update
+        self.holdUntil = 0
+        self.drain = 0
+        self.relay.value = False
+        return False
 
     def update(self):
+        # Keep UART responsive while waiting out a charge/balance period
+        if self.holdUntil and self.hold():
+            self.sercom()
+            return
+
+        # Low power is checked first so no measurement traffic happens while shut down
+        if self.mode == 2:
+            if not self.asleep:
+                self.buz.value = False
+                self.mos.value = False
+                self.relay.value = False
+                self.drain = 0
+                self.sendIO()
+                BMS.ADS1248.sleepAll()
+                self.asleep = True
+            self.sercom()
+            return
+        if self.asleep:
+            BMS.ADS1248.wakeupAll()
+            self.asleep = False
+
         # All the stuff
         if self.mode == 0 or self.mode == 1:
             self.sendIO()
@@ -268,13 +372,13 @@ class BMS:
                 if self.verbose:
                     print("[INFO] Allowing cells to settle...")
                 time.sleep(5)
+            # Last reading becomes the reference, getCells refills the older buffer in place
+            self.lastCells, self.cells = self.cells, self.lastCells
             for i in range(4):
                 self.getCells()
-                dCells = []
-                for i in range(self.cellCount):
-                    dCells.append(self.cells[i]-self.lastCells[i])
+                dCells = self.cells - self.lastCells
                 if self.mode == 1:
-                    if max(dCells) > self.errorDetect or min(dCells) < -self.errorDetect:
+                    if ulab.numerical.max(dCells) > self.errorDetect or ulab.numerical.min(dCells) < -self.errorDetect:
                         if self.verbose:
                             print("[INFO] Measure error, trying again...")
                         self.error = True
@@ -296,21 +400,22 @@ class BMS:
                 self.buz.value = False
 
             if self.verbose:
-                print("[INFO] Mean change in voltage per cell:",sum(dCells)/self.cellCount)
+                print("[INFO] Mean change in voltage per cell:",ulab.numerical.mean(dCells))
 
-            self.lastCells = list(self.cells)
             if self.verbose:
                 # print("[INFO] All cell voltages:\n",self.cells)
                 print("[INFO] Battery voltage: {}v".format(self.battVoltage))
                 print("[INFO] Battery capacity: {}%".format(self.capacity))
 
-            for i in range(self.cellCount):
-                if self.cells[i] > self.maxVoltage:
-                    print("\n[ALERT] Cell_{0} is above maximum voltage of {1} at {2}!\n".format(i,self.maxVoltage, self.cells[i]))
-                    self.mode = 2
-                elif self.cells[i] < self.minVoltage:
-                    print("\n[ALERT] Cell_{0} is below minimum voltage of {1} at {2}!\n".format(i,self.minVoltage, self.cells[i]))
-                    self.mode = 2
+            # minCell/maxCell already bound every cell, only scan for the offenders on a fault
+            if self.maxCell > self.maxVoltage or self.minCell < self.minVoltage:
+                for i in range(self.cellCount):
+                    if self.cells[i] > self.maxVoltage:
+                        print("\n[ALERT] Cell_{0} is above maximum voltage of {1} at {2}!\n".format(i,self.maxVoltage, self.cells[i]))
+                        self.mode = 2
+                    elif self.cells[i] < self.minVoltage:
+                        print("\n[ALERT] Cell_{0} is below minimum voltage of {1} at {2}!\n".format(i,self.minVoltage, self.cells[i]))
+                        self.mode = 2
 
             if self.minCell < self.shutdownVoltage and not self.saveBattery:
                 print("[ALERT] Minimum cell voltage is below shutdown voltage, so...shutting down.")
@@ -345,121 +450,148 @@ class BMS:
             else:
                 print("[INFO] Charge/balance/discharge is not enabled due to a battery measurement error.")
 
-        elif self.mode == 2:
-            self.buz.value = False
-            self.mos.value = False
-            self.relay.value = False
-            self.drain = [0]*self.cellCount
-            self.sendIO()
-            BMS.ADS1248.sleepAll()
+        self.sercom()
 
-        # Sercom
-        recv = self.uart.read(1)
-        if recv != None:
-            command = recv[0]
+    def sercom(self):
+        n = self.uart.readinto(self._rxBuf)
+        if not n:
+            return
+        # Several instructions may have queued up while update() was busy, handle them in order
+        off = 0
+        while off < n:
+            command = self._rxBuf[off]
+            off += 1
             print("[UART] Received command:",command)
             try:
-                if command >= 128: # Writing information to BMS
-                    data = ''.join([chr(i) for i in self.uart.read()])
+                if command >= 128: # Writing information to BMS, data runs to the end of the read
+                    data = bytes(self._rxBuf[off:n]).decode('ascii')
+                    off = n
                     print("[UART] Received data:",data)
-                    if command == 128: # Mode
-                        if data == "0":
-                            self.mode = 0
-                        elif data == "1":
-                            self.mode = 1
-                        elif data == "2":
-                            self.mode = 2
-                        if self.verbose:
-                            print("[INFO] Changed mode to",self.mode)
-                    elif command == 133: # Target cell voltage
-                        self.targetVoltage = float(data)
-                        if self.verbose:
-                            print("[INFO] Set target voltage to",float(data))
-                    elif command == 129: # Maximum temperature
-                        self.maxTemp = float(data)
-                        if self.verbose:
-                            print("[INFO] Set maximum temperature to",float(data))
-                    elif command == 130: # Fan trigger temperature
-                        self.fanTrigger = float(data)
-                        if self.verbose:
-                            print("[INFO] Set fan trigger temperature to",float(data))
-                    elif command == 131: # Minimum cell voltage
-                        self.minVoltage = float(data)
-                        if self.verbose:
-                            print("[INFO] Set minimum cell voltage to",float(data))
-                    elif command == 132: # Maximum cell voltage
-                        self.maxVoltage = float(data)
-                        if self.verbose:
-                            print("[INFO] Set maximum cell voltage to",float(data))
-                    elif command == 134: # Maximum cell voltage difference (for balancing)
-                        self.dV = float(data)
-                        if self.verbose:
-                            print("[INFO] Set maximum cell voltage difference for balancing to",float(data))
-                    elif command == 135: # Time for charge/balance between measurements
-                        self.balTime = int(data)
-                        if self.verbose:
-                            print("[INFO] Set charge/balance time",int(data))
-                    elif command == 136: # Verbosity
-                        self.verbose = bool(data)
-                        if self.verbose:
-                            print("[INFO] Set verbosity to",bool(data))
-
-                elif command < 128: # Requesting information from BMS
-                    if command == 1: # Battery voltage | 7 bytes
-                        self.uart.write(bytes(str(self.battVoltage),'utf-8'))
-                        self.uart.write(bytes(''.join(["0" for i in range(7-len(str(self.battVoltage)))]), 'utf-8'))
-                        if self.verbose:
-                            print("[UART] Sent battery voltage.")
-                    elif command == 2: # Battery capacity | 2 bytes
-                        self.uart.write(bytes(str(self.capacity),'utf-8'))
-                        if self.verbose:
-                            print("[UART] Sent battery capacity.")
-                    elif command == 3: # Mean cell voltage | 7 bytes
-                        self.uart.write(bytes(str(self.meanVoltage),'utf-8'))
-                        self.uart.write(bytes(''.join(["0" for i in range(7-len(str(self.meanVoltage)))]), 'utf-8'))
-                        if self.verbose:
-                            print("[UART] Sent mean cell voltage.")
-                    elif command == 4:
-                        self.uart.write(bytes(str(self.minCell),'utf-8'))
-                        self.uart.write(bytes(''.join(["0" for i in range(7-len(str(self.minCell)))]), 'utf-8'))
-                        if self.verbose:
-                            print("[UART] Sent minimum cell voltage.")
-                    elif command == 5:
-                        self.uart.write(bytes(str(self.maxCell),'utf-8'))
-                        self.uart.write(bytes(''.join(["0" for i in range(7-len(str(self.maxCell)))]), 'utf-8'))
-                        if self.verbose:
-                            print("[UART] Sent maximum cell voltage.")
-                    elif command == 6: # All cell voltages | 160 bytes
-                        for cell in self.cells:
-                            self.uart.write(bytes(str(cell),'utf-8'))
-                            self.uart.write(bytes(''.join(["0" for i in range(7-len(str(cell)))]), 'utf-8')+bytes("\n", 'utf-8'))
-                        if self.verbose:
-                            print("[UART] Sent all cell voltages.")
-                    elif command == 7: # Temperatures | 30 bytes
-                        for temp in self.temps:
-                            self.uart.write(bytes(str(temp),'utf-8'))
-                            self.uart.write(bytes(''.join(["0" for i in range(5-len(str(temp)))]), 'utf-8')+bytes("\n", 'utf-8'))
-                        if self.verbose:
-                            print("[UART] Sent all temperatures.")
-                    elif command == 8: # Status | 7 bytes
-                        status = [0]*7
-                        if self.mode == 2:
-                            status[0] = 1
-                        if self.minCell < self.warningVoltage:
-                            status[1] = 1
-                        if self.minCell < self.minVoltage:
-                            status [2] = 1
-                        if self.maxCell > self.maxVoltage:
-                            status[3] = 1
-                        if microcontroller.nvm[0] == 2: # Fatal measurement/battery error
-                            status[4] = 1
-                        if self.maxCell - self.minCell > self.dV:
-                            status[5] = 1
-                        if max(self.temps) > self.maxTemp:
-                            status[6] = 1
-                        if self.verbose:
-                            print("[UART] Sent status summary.")
+                    handler = self._writeHandlers.get(command)
+                    if handler:
+                        handler(data)
+                else: # Requesting information from BMS
+                    handler = self._readHandlers.get(command)
+                    if handler:
+                        handler()
             except ValueError:
                 self.uart.write(bytes(255))
                 if self.verbose:
                     print("[ALERT] UART command was formatted incorrectly. Discarding.")
+
+    # SERCOM write handlers
+
+    def setMode(self, data):
+        if data == "0":
+            self.mode = 0
+        elif data == "1":
+            self.mode = 1
+        elif data == "2":
+            self.mode = 2
+        if self.verbose:
+            print("[INFO] Changed mode to",self.mode)
+
+    def setMaxTemp(self, data):
+        self.maxTemp = float(data)
+        if self.verbose:
+            print("[INFO] Set maximum temperature to",self.maxTemp)
+
+    def setFanTrigger(self, data):
+        self.fanTrigger = float(data)
+        if self.verbose:
+            print("[INFO] Set fan trigger temperature to",self.fanTrigger)
+
+    def setMinVoltage(self, data):
+        self.minVoltage = float(data)
+        if self.verbose:
+            print("[INFO] Set minimum cell voltage to",self.minVoltage)
+
+    def setMaxVoltage(self, data):
+        self.maxVoltage = float(data)
+        if self.verbose:
+            print("[INFO] Set maximum cell voltage to",self.maxVoltage)
+
+    def setTargetVoltage(self, data):
+        self.targetVoltage = float(data)
+        if self.verbose:
+            print("[INFO] Set target voltage to",self.targetVoltage)
+
+    def setDV(self, data):
+        self.dV = float(data)
+        if self.verbose:
+            print("[INFO] Set maximum cell voltage difference for balancing to",self.dV)
+
+    def setBalTime(self, data):
+        self.balTime = int(data)
+        if self.verbose:
+            print("[INFO] Set charge/balance time",self.balTime)
+
+    def setVerbose(self, data):
+        self.verbose = bool(data)
+        if self.verbose:
+            print("[INFO] Set verbosity to",self.verbose)
+
+    # SERCOM read handlers
+
+    def sendBattVoltage(self): # 7 bytes
+        self.uart.write(pad(self.battVoltage))
+        if self.verbose:
+            print("[UART] Sent battery voltage.")
+
+    def sendCapacity(self): # 2 bytes
+        self.uart.write(bytes(str(self.capacity),'utf-8'))
+        if self.verbose:
+            print("[UART] Sent battery capacity.")
+
+    def sendMeanVoltage(self): # 7 bytes
+        self.uart.write(pad(self.meanVoltage))
+        if self.verbose:
+            print("[UART] Sent mean cell voltage.")
+
+    def sendMinCell(self): # 7 bytes
+        self.uart.write(pad(self.minCell))
+        if self.verbose:
+            print("[UART] Sent minimum cell voltage.")
+
+    def sendMaxCell(self): # 7 bytes
+        self.uart.write(pad(self.maxCell))
+        if self.verbose:
+            print("[UART] Sent maximum cell voltage.")
+
+    def sendCells(self): # 160 bytes
+        self.uart.write(b''.join([pad(cell)+b'\n' for cell in self.cells]))
+        if self.verbose:
+            print("[UART] Sent all cell voltages.")
+
+    def sendTemps(self): # 30 bytes
+        self.uart.write(b''.join([pad(round(temp,2),5)+b'\n' for temp in self.temps]))
+        if self.verbose:
+            print("[UART] Sent all temperatures.")
+
+    def sendStatus(self): # 7 bytes
+        status = [0]*7
+        if self.mode == 2:
+            status[0] = 1
+        if self.minCell < self.warningVoltage:
+            status[1] = 1
+        if self.minCell < self.minVoltage:
+            status [2] = 1
+        if self.maxCell > self.maxVoltage:
+            status[3] = 1
+        if microcontroller.nvm[0] == 2: # Fatal measurement/battery error
+            status[4] = 1
+        if self.maxCell - self.minCell > self.dV:
+            status[5] = 1
+        if max(self.temps) > self.maxTemp:
+            status[6] = 1
+        if self.verbose:
+            print("[UART] Sent status summary.")
+
+    def sendCellsMillivolts(self): # 100 bytes
+        c = self.cells
+        buf = self._cellBuf
+        for i in range(self.cellCount):
+            putMillivolts(c[i], buf, 5*i)
+        self.uart.write(buf)
+        if self.verbose:
+            print("[UART] Sent all cell voltages in millivolts.")